@@ -1,27 +1,236 @@
 """
-Audio/Video transcription using OpenAI Whisper
+Audio/Video transcription using Whisper (faster-whisper / CTranslate2 backend)
 Supports .m4a and .mp4 files
 
 Usage:
 python transcribe.py audio.m4a transcript.txt
 python transcribe.py video.mp4 output.txt --model medium
+python transcribe.py audio.m4a transcript.txt --format plain
+
+python transcribe.py --inputs a.m4a b.mp4 c.m4a --output-dir output
+
+Library usage (the model stays loaded between calls):
+from transcribe import transcribe_audio
+transcribe_audio("audio.m4a", "transcript.txt", model_size="medium")
 """
 
 import argparse
-import whisper
+from concurrent.futures import ThreadPoolExecutor
+import ctranslate2
+from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+import functools
+from itertools import chain
+import numpy as np
 import os
+import re
 import sys
 
-def transcribe_audio(input_file, output_file, model_size="base", snippet_size=5):
+COMPUTE_TYPES = ["int8", "int8_float16", "float16", "float32"]
+DEVICES = ["auto", "cpu", "cuda"]
+FORMATS = ["plain", "second", "snippet"]
+
+# Stock phrases Whisper hallucinates over silence/music (compared lowercased,
+# punctuation removed, against each sentence of a segment)
+BLACKLIST = {
+    "thanks for watching",
+    "thank you for watching",
+    "thanks for watching and please subscribe",
+    "please subscribe",
+    "please like and subscribe",
+    "dont forget to like and subscribe",
+    "subscribe to my channel",
+    "see you in the next video",
+    "subtitles by the amaraorg community",
+}
+
+# A decoding loop is a 3- to 6-word phrase repeated back to back more than
+# LOOP_MAX_REPEATS times; the repeats after the first occurrence are cut
+LOOP_NGRAM_SIZES = range(3, 7)
+LOOP_MAX_REPEATS = 4
+
+SENTENCE_ENDINGS = (".", "!", "?")
+
+# Below this many words numba's call overhead outweighs the compiled loop
+NUMBA_MIN_WORDS = 2000
+
+# Whisper stops getting faster past ~8 CPU threads and can get slower;
+# an explicit OMP_NUM_THREADS still takes precedence
+MAX_CPU_THREADS = 8
+
+def _pick_device(device="auto"):
+    """Resolve 'auto' to 'cuda' when CTranslate2 can see a CUDA device, else 'cpu'"""
+    if device != "auto":
+        return device
+    return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+def _cpu_threads():
+    """Return OMP_NUM_THREADS when set, otherwise min(MAX_CPU_THREADS, CPU count)"""
+    omp_threads = os.environ.get("OMP_NUM_THREADS", "")
+    if omp_threads.isdigit() and int(omp_threads) > 0:
+        return int(omp_threads)
+    return min(MAX_CPU_THREADS, os.cpu_count() or 1)
+
+def _default_compute_type(device):
+    """Return float16 on CUDA and int8 on CPU"""
+    return "float16" if device == "cuda" else "int8"
+
+@functools.lru_cache(maxsize=4)
+def _load_model(model_size, device, device_index, compute_type):
+    """Load a WhisperModel; repeat calls with the same arguments return the cached instance"""
+    print(f"Loading Whisper model: {model_size} ({device}:{device_index}, {compute_type})")
+    return WhisperModel(model_size, device=device, device_index=device_index,
+                        compute_type=compute_type,
+                        cpu_threads=_cpu_threads())
+
+class WhisperManager:
+    """
+    Process-wide cache for loaded Whisper models
+    
+    Loading weights takes 10-30s, so repeated transcribe_audio calls in the
+    same process reuse a model as long as (model_size, device, device_index,
+    compute_type) matches. Multi-GPU runs keep one model per GPU. Up to four
+    models are kept; the least recently used one is dropped after that.
+    """
+    
+    @classmethod
+    def get_model(cls, model_size, device, device_index=0, compute_type=None):
+        """
+        Return the cached model for this key, loading it on first use
+        
+        Args:
+            model_size (str): Whisper model size (tiny, base, small, medium, large)
+            device (str): 'cuda' or 'cpu'
+            device_index (int): GPU index when device is 'cuda' (default: 0)
+            compute_type (str): CTranslate2 weight/compute precision
+                (default: float16 on CUDA, int8 on CPU)
+        """
+        compute_type = compute_type or _default_compute_type(device)
+        return _load_model(model_size, device, device_index, compute_type)
+    
+    @classmethod
+    def clear(cls):
+        """Drop every cached model so its memory (or VRAM) can be released"""
+        _load_model.cache_clear()
+
+def _to_result(segments):
     """
-    Transcribe audio/video file using OpenAI Whisper with configurable snippet timestamps
+    Convert faster-whisper segments into the openai-whisper result layout
     
     Args:
-        input_file (str): Path to input audio/video file (.m4a or .mp4)
-        output_file (str): Path to output transcript text file
-        model_size (str): Whisper model size (tiny, base, small, medium, large)
-        snippet_size (int): Size of each snippet in seconds (default: 5)
+        segments: Iterable of faster-whisper Segment objects
+        
+    Returns:
+        dict: {"text": ..., "segments": [{"start", "end", "text", "words"}, ...]}
+    """
+    result_segments = []
+    for s in segments:
+        result_segments.append({
+            "start": s.start,
+            "end": s.end,
+            "text": s.text,
+            "words": [{"start": w.start, "word": w.word} for w in s.words or ()],
+        })
+    return {
+        "text": "".join(segment["text"] for segment in result_segments),
+        "segments": result_segments,
+    }
+
+def _normalize(text):
+    """Lowercase text and remove punctuation for loop/blacklist comparisons"""
+    return re.sub(r"[^\w\s]", "", text.lower()).strip()
+
+def _find_loop(keys, i):
+    """Return (n, repeats) if an n-gram starting at keys[i] loops, otherwise None"""
+    for n in LOOP_NGRAM_SIZES:
+        ngram = keys[i:i + n]
+        if len(ngram) < n:
+            break
+        repeats = 1
+        while keys[i + repeats * n:i + (repeats + 1) * n] == ngram:
+            repeats += 1
+        if repeats > LOOP_MAX_REPEATS:
+            return n, repeats
+    return None
+
+def _clean_tokens(tokens, text_of):
     """
+    Remove hallucinated spans from a segment's tokens
+    
+    Each repetition loop is collapsed to its first occurrence, then sentences
+    (runs of tokens ending in . ! or ?) that are a BLACKLIST phrase are
+    dropped. The speech around them is kept.
+    
+    Args:
+        tokens (list): Word dicts or plain word strings of one segment
+        text_of: Function returning a token's text
+        
+    Returns:
+        list: The tokens that are kept, in order
+    """
+    keys = [_normalize(text_of(token)) for token in tokens]
+    
+    kept = []
+    i = 0
+    while i < len(tokens):
+        loop = _find_loop(keys, i)
+        if loop:
+            n, repeats = loop
+            kept.extend(range(i, i + n))
+            i += n * repeats
+        else:
+            kept.append(i)
+            i += 1
+    
+    cleaned = []
+    sentence = []
+    for position, index in enumerate(kept):
+        sentence.append(index)
+        if (text_of(tokens[index]).rstrip().endswith(SENTENCE_ENDINGS)
+                or position == len(kept) - 1):
+            if " ".join(keys[j] for j in sentence if keys[j]) not in BLACKLIST:
+                cleaned.extend(tokens[j] for j in sentence)
+            sentence = []
+    return cleaned
+
+def _filter_loops(result):
+    """
+    Cut hallucinated text out of a transcription result in place
+    
+    Batched segments are VAD chunks of up to 30s, so only the looping or
+    boilerplate span is removed (from the words when present, otherwise from
+    the segment text); segments left empty are dropped and result["text"] is
+    rebuilt.
+    
+    Args:
+        result: Whisper transcription result (as returned by _to_result)
+    """
+    removed = 0
+    kept = []
+    for segment in result["segments"]:
+        words = segment.get("words")
+        tokens = words or segment["text"].split()
+        cleaned = _clean_tokens(tokens, (lambda word: word["word"]) if words else str)
+        if len(cleaned) == len(tokens):
+            kept.append(segment)
+            continue
+        
+        removed += len(tokens) - len(cleaned)
+        if not cleaned:
+            continue
+        if words:
+            segment["words"] = cleaned
+            segment["text"] = "".join(word["word"] for word in cleaned)
+        else:
+            segment["text"] = " " + " ".join(cleaned)
+        kept.append(segment)
+    
+    if removed:
+        print(f"Removed {removed} hallucinated word(s)")
+    result["segments"] = kept
+    result["text"] = "".join(segment["text"] for segment in kept)
+
+def _validate_input(input_file):
+    """Raise if input_file does not exist or is not a supported .m4a/.mp4 file"""
     
     # Validate input file exists
     if not os.path.exists(input_file):
@@ -32,107 +241,366 @@ def transcribe_audio(input_file, output_file, model_size="base", snippet_size=5)
     file_ext = os.path.splitext(input_file)[1].lower()
     if file_ext not in valid_extensions:
         raise ValueError(f"Unsupported file format: {file_ext}. Supported: {valid_extensions}")
+
+def transcribe_audio(input_file, output_file, model_size="base", snippet_size=5, device_index=0,
+                     batch_size=16, compute_type=None, word_timestamps=None, device="auto",
+                     model=None):
+    """
+    Transcribe audio/video file using faster-whisper with configurable snippet timestamps
+    
+    Args:
+        input_file (str): Path to input audio/video file (.m4a or .mp4)
+        output_file (str): Path to output transcript text file
+        model_size (str): Whisper model size (tiny, base, small, medium, large)
+        snippet_size (int): Size of each snippet in seconds (default: 5); 1 gives
+            one line per second, None writes the plain text without timestamps
+        device_index (int): GPU to run on when CUDA is available (default: 0)
+        batch_size (int): Number of VAD chunks decoded in parallel (default: 16)
+        compute_type (str): int8, int8_float16, float16 or float32
+            (default: float16 on CUDA, int8 on CPU)
+        word_timestamps (bool): Align individual words; otherwise each segment is
+            written with its own start/end (default: on unless snippet_size
+            is None)
+        device (str): 'auto', 'cpu' or 'cuda'; 'auto' uses CUDA when available
+        model (WhisperModel): Already loaded model to use instead of fetching one
+            from WhisperManager (model_size, device, device_index and
+            compute_type are then ignored)
+        
+    Returns:
+        str: Path of the written transcript (output_file)
+    """
+    _validate_input(input_file)
     
-    print(f"Loading Whisper model: {model_size}")
-    model = whisper.load_model(model_size)
+    # Load (or fetch the cached) model on a worker thread while this thread
+    # decodes the audio once to a 16kHz mono float32 waveform shared by VAD
+    # and decoding; both release the GIL
+    if model is None:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            model_future = executor.submit(WhisperManager.get_model, model_size,
+                                           _pick_device(device), device_index, compute_type)
+            print(f"Decoding audio: {input_file}")
+            audio = decode_audio(input_file)
+            model = model_future.result()
+    else:
+        print(f"Decoding audio: {input_file}")
+        audio = decode_audio(input_file)
     
-    print(f"Transcribing with word-level timestamps: {input_file}")
-    result = model.transcribe(input_file, word_timestamps=True)
+    # Batched segments are whole VAD chunks of up to 30s, so snippet output
+    # needs word timestamps; only plain text can skip the alignment pass
+    if word_timestamps is None:
+        word_timestamps = snippet_size is not None
     
-    # Group words by snippet intervals
-    timestamped_transcript = create_snippet_intervals(result, snippet_size)
+    level = "word" if word_timestamps else "segment"
+    print(f"Transcribing with {level}-level timestamps: {input_file}")
+    # Silero VAD splits the audio into <=30s speech chunks which are decoded
+    # in batches; segment timestamps come back relative to the whole file
+    pipeline = BatchedInferencePipeline(model=model)
+    segments, _ = pipeline.transcribe(audio, batch_size=batch_size,
+                                      word_timestamps=word_timestamps, vad_filter=True)
+    # Segments are decoded lazily; consuming them here runs the transcription
+    result = _to_result(segments)
+    _filter_loops(result)
     
-    # Write to output file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(timestamped_transcript)
+    # Group words by snippet intervals, streaming each line to the output file
+    # Binary mode: lines are encoded to UTF-8 once, skipping the text layer
+    with open(os.fspath(output_file), 'wb', buffering=1 << 20) as f:
+        write_snippet_intervals(result, snippet_size, f)
     
-    print(f"Timestamped transcript saved to: {output_file}")
-    return timestamped_transcript
+    print(f"Transcript saved to: {output_file}")
+    return output_file
 
-def create_snippet_intervals(result, snippet_size):
+def transcribe_files(input_files, output_dir, model_size="base", snippet_size=5, batch_size=16,
+                     compute_type=None, word_timestamps=None, device="auto"):
+    """
+    Transcribe several files in one process, spreading them across GPUs
+    
+    Files are assigned round-robin to the visible GPUs. Each GPU gets one
+    worker thread that loads its model once and works through its share in
+    order, so a model is never used by two threads at once and is not
+    subject to eviction from the WhisperManager cache mid-run. With no GPU or a single
+    GPU the files are transcribed sequentially on one model.
+    
+    Args:
+        input_files (list): Paths to input audio/video files (.m4a or .mp4)
+        output_dir (str): Directory for the <name>.transcript.txt outputs
+        model_size (str): Whisper model size (tiny, base, small, medium, large)
+        snippet_size (int): Size of each snippet in seconds (default: 5); 1 gives
+            one line per second, None writes the plain text without timestamps
+        batch_size (int): Number of VAD chunks decoded in parallel (default: 16)
+        compute_type (str): int8, int8_float16, float16 or float32
+            (default: float16 on CUDA, int8 on CPU)
+        word_timestamps (bool): Align individual words; otherwise each segment is
+            written with its own start/end (default: on unless snippet_size
+            is None)
+        device (str): 'auto', 'cpu' or 'cuda'; 'auto' uses CUDA when available
+        
+    Returns:
+        list: Output transcript paths, in the same order as input_files
+    """
+    # Check every input before loading any model, so one bad path cannot
+    # stop a GPU's queue halfway through
+    for input_file in input_files:
+        _validate_input(input_file)
+    
+    output_files = [
+        os.path.join(output_dir, os.path.splitext(os.path.basename(f))[0] + ".transcript.txt")
+        for f in input_files
+    ]
+    
+    # Inputs sharing a name (a/talk.m4a, b/talk.mp4) would overwrite each other
+    seen = {}
+    for input_file, output_file in zip(input_files, output_files):
+        if output_file in seen:
+            raise ValueError(f"{seen[output_file]} and {input_file} would both be "
+                             f"written to {output_file}")
+        seen[output_file] = input_file
+    
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = list(zip(input_files, output_files))
+    
+    device = _pick_device(device)
+    n_gpus = ctranslate2.get_cuda_device_count() if device == "cuda" else 0
+    n_workers = min(n_gpus, len(jobs))
+    if n_workers <= 1:
+        for input_file, output_file in jobs:
+            transcribe_audio(input_file, output_file, model_size, snippet_size,
+                             batch_size=batch_size, compute_type=compute_type,
+                             word_timestamps=word_timestamps, device=device)
+        return output_files
+    
+    def run_on_gpu(device_index):
+        model = WhisperManager.get_model(model_size, device, device_index, compute_type)
+        for input_file, output_file in jobs[device_index::n_workers]:
+            transcribe_audio(input_file, output_file, snippet_size=snippet_size,
+                             batch_size=batch_size, word_timestamps=word_timestamps,
+                             model=model)
+    
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = [executor.submit(run_on_gpu, i) for i in range(n_workers)]
+        for future in futures:
+            future.result()
+    
+    return output_files
+
+def create_snippet_intervals(result, snippet_size=None):
     """
     Create transcript with configurable snippet intervals from Whisper word timestamps
     
     Args:
         result: Whisper transcription result with word timestamps
-        snippet_size (int): Size of each snippet in seconds
+        snippet_size (int): Size of each snippet in seconds, or None for the
+            plain transcript text without timestamps
         
     Returns:
         str: Formatted transcript with [MM:SS - MM:SS] timestamps
     """
-    lines = []
+    return "\n".join(_iter_lines(result, snippet_size))
+
+def write_snippet_intervals(result, snippet_size, fh):
+    """
+    Write the snippet transcript line by line instead of building one string
     
-    # Extract all words with timestamps from all segments
-    all_words = []
-    for segment in result["segments"]:
-        if "words" in segment:
-            all_words.extend(segment["words"])
-    
-    if not all_words:
-        # Fallback to segment-level timestamps if word-level not available
-        for segment in result["segments"]:
-            start_time = int(segment["start"])
-            end_time = int(segment["end"])
-            start_minutes = start_time // 60
-            start_seconds = start_time % 60
-            end_minutes = end_time // 60
-            end_seconds = end_time % 60
-            timestamp = f"[{start_minutes}:{start_seconds:02d} - {end_minutes}:{end_seconds:02d}]"
-            lines.append(f"{timestamp} {segment['text'].strip()}")
-        return "\n".join(lines)
-    
-    # Group words by snippet intervals
-    current_snippet_start = 0
-    current_words = []
-    
-    for word in all_words:
-        word_second = int(word["start"])
+    Args:
+        result: Whisper transcription result with word timestamps
+        snippet_size (int): Size of each snippet in seconds, or None for the
+            plain transcript text without timestamps
+        fh: File handle opened in binary mode; lines are written as UTF-8
+    """
+    for line in _iter_lines(result, snippet_size):
+        fh.write(line.encode('utf-8'))
+        fh.write(b"\n")
+
+def _iter_lines(result, snippet_size):
+    """
+    Yield formatted transcript lines in a single pass over result["segments"]
+    
+    Consecutive segments with word timestamps are grouped into snippets; a
+    segment without words falls back to its own segment-level timestamps.
+    With snippet_size None the plain transcript text is the only line.
+    """
+    if snippet_size is None:
+        text = result["text"].strip()
+        if text:
+            yield text
+        return
+    
+    segments = result["segments"]
+    
+    # Snippet labels, built on the first flush of word-timestamped segments
+    labels = None
+    
+    # Word lists of the current run of word-timestamped segments (no copies)
+    pending = []
+    
+    for segment in segments:
+        words = segment.get("words")
+        if words:
+            pending.append(words)
+            continue
         
-        # If we've moved to a new snippet interval, output the previous snippet
-        while current_snippet_start + snippet_size <= word_second:
-            if current_words:
-                start_minutes = current_snippet_start // 60
-                start_seconds = current_snippet_start % 60
-                end_minutes = (current_snippet_start + snippet_size - 1) // 60
-                end_seconds = (current_snippet_start + snippet_size - 1) % 60
-                timestamp = f"[{start_minutes}:{start_seconds:02d} - {end_minutes}:{end_seconds:02d}]"
-                text = " ".join(current_words).strip()
-                if text:  # Only add non-empty lines
-                    lines.append(f"{timestamp} {text}")
-                current_words = []
-            current_snippet_start += snippet_size
+        if pending:
+            labels = labels or _snippet_labels(segments, snippet_size)
+            yield from _iter_snippets(pending, snippet_size, labels)
+            pending = []
         
-        # Add word to current snippet if it falls within the current interval
-        if current_snippet_start <= word_second < current_snippet_start + snippet_size:
-            current_words.append(word["word"].strip())
-    
-    # Handle any remaining words
-    if current_words:
-        start_minutes = current_snippet_start // 60
-        start_seconds = current_snippet_start % 60
-        end_minutes = (current_snippet_start + snippet_size - 1) // 60
-        end_seconds = (current_snippet_start + snippet_size - 1) % 60
+        start_minutes, start_seconds = divmod(int(segment["start"]), 60)
+        end_minutes, end_seconds = divmod(int(segment["end"]), 60)
         timestamp = f"[{start_minutes}:{start_seconds:02d} - {end_minutes}:{end_seconds:02d}]"
-        text = " ".join(current_words).strip()
+        yield f"{timestamp} {segment['text'].strip()}"
+    
+    if pending:
+        labels = labels or _snippet_labels(segments, snippet_size)
+        yield from _iter_snippets(pending, snippet_size, labels)
+
+def _snippet_labels(segments, snippet_size):
+    """
+    Precompute the "[M:SS - M:SS]" label of every snippet up to the end of
+    the audio so the hot loop does a list lookup instead of formatting
+    """
+    max_second = int(segments[-1]["end"]) + snippet_size
+    return [_snippet_label(start, snippet_size) for start in range(0, max_second + 1, snippet_size)]
+
+def _snippet_label(snippet_start, snippet_size):
+    """Format the [M:SS - M:SS] timestamp of the snippet starting at snippet_start"""
+    start_minutes, start_seconds = divmod(snippet_start, 60)
+    end_minutes, end_seconds = divmod(snippet_start + snippet_size - 1, 60)
+    return f"[{start_minutes}:{start_seconds:02d} - {end_minutes}:{end_seconds:02d}]"
+
+def _bucket_boundaries(starts, snippet_size):
+    """
+    Find where the snippet bucket changes in an array of word start times
+    
+    Whisper can start a word slightly before the previous one ends, so bucket
+    ids are clamped to be non-decreasing: a word that starts early joins the
+    current snippet instead of reopening an earlier one.
+    
+    Args:
+        starts (np.ndarray): float64 word start times in seconds
+        snippet_size (int): Size of each snippet in seconds
+        
+    Returns:
+        tuple: (bucket_ids, first_index) int64 arrays, one entry per run of
+            words that share a bucket
+    """
+    buckets = np.maximum.accumulate(starts.astype(np.int64) // snippet_size)
+    first_index = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+    return buckets[first_index], first_index
+
+def _bucket_boundaries_loop(starts, snippet_size):
+    """Single-pass loop version of _bucket_boundaries, compiled with numba"""
+    n = starts.shape[0]
+    bucket_ids = np.empty(n, dtype=np.int64)
+    first_index = np.empty(n, dtype=np.int64)
+    count = 0
+    for i in range(n):
+        bucket = int(starts[i]) // snippet_size
+        if count == 0 or bucket > bucket_ids[count - 1]:
+            bucket_ids[count] = bucket
+            first_index[count] = i
+            count += 1
+    return bucket_ids[:count], first_index[:count]
+
+@functools.lru_cache(maxsize=None)
+def _bucket_boundaries_jit():
+    """
+    Return the numba-compiled _bucket_boundaries_loop, or None without numba
+    
+    numba is imported here rather than at module level because importing it
+    costs ~0.2s and the compiled loop is only used for long transcripts.
+    """
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; snippet grouping falls back to NumPy
+        return None
+    return njit(cache=True)(_bucket_boundaries_loop)
+
+def _iter_snippets(word_lists, snippet_size, labels):
+    """Yield one snippet line per non-empty snippet_size bucket of words"""
+    # One pass over the word dicts into parallel start/text arrays; words are
+    # stripped once here and empty ones dropped, so groups can be joined
+    # without a trailing strip() and every group produces a line
+    word_starts = []
+    word_texts = []
+    append_start = word_starts.append
+    append_text = word_texts.append
+    for word in chain.from_iterable(word_lists):
+        text = word["word"].strip()
         if text:
-            lines.append(f"{timestamp} {text}")
+            append_start(word["start"])
+            append_text(text)
+    if not word_texts:
+        return
     
-    return "\n".join(lines)
+    starts = np.array(word_starts, dtype=np.float64)
+    words = np.array(word_texts, dtype=object)
+    
+    # Bucket every word by snippet index, then split the word array wherever
+    # the bucket changes
+    bucket_boundaries = _bucket_boundaries
+    if words.size > NUMBA_MIN_WORDS:
+        bucket_boundaries = _bucket_boundaries_jit() or _bucket_boundaries
+    bucket_ids, first_index = bucket_boundaries(starts, snippet_size)
+    
+    for bucket, group in zip(bucket_ids.tolist(), np.split(words, first_index[1:])):
+        if bucket < len(labels):
+            timestamp = labels[bucket]
+        else:  # Word starts past the last segment's end
+            timestamp = _snippet_label(bucket * snippet_size, snippet_size)
+        yield f"{timestamp} {' '.join(group)}"
 
 def main():
-    parser = argparse.ArgumentParser(description="Transcribe audio/video files using OpenAI Whisper")
-    parser.add_argument("input_file", help="Input audio/video file (.m4a or .mp4)")
-    parser.add_argument("output_file", help="Output transcript text file")
+    parser = argparse.ArgumentParser(description="Transcribe audio/video files using Whisper (faster-whisper)")
+    parser.add_argument("input_file", nargs="?", help="Input audio/video file (.m4a or .mp4)")
+    parser.add_argument("output_file", nargs="?", help="Output transcript text file")
+    parser.add_argument("--inputs", nargs="+", metavar="FILE",
+                       help="Transcribe several files with one loaded model per GPU")
+    parser.add_argument("--output-dir", default="output",
+                       help="Output directory for --inputs transcripts (default: output)")
     parser.add_argument("--model", default="base", 
                        choices=["tiny", "base", "small", "medium", "large"],
                        help="Whisper model size (default: base)")
-    parser.add_argument("--snippet-size", type=int, default=5,
-                       help="Size of each snippet in seconds (default: 5)")
+    parser.add_argument("--format", default="snippet", choices=FORMATS,
+                       help="plain text, one line per second, or one line per "
+                            "--snippet-size seconds (default: snippet)")
+    parser.add_argument("--snippet-size", type=int, default=None,
+                       help="Size of each snippet in seconds, only with --format snippet (default: 5)")
+    parser.add_argument("--batch-size", type=int, default=16,
+                       help="Number of speech chunks decoded in parallel (default: 16)")
+    parser.add_argument("--device", default="auto", choices=DEVICES,
+                       help="Device to run on (default: auto, CUDA when available)")
+    parser.add_argument("--compute-type", default=None, choices=COMPUTE_TYPES,
+                       help="Model precision (default: float16 on GPU, int8 on CPU)")
+    parser.add_argument("--word-timestamps", default=None, action=argparse.BooleanOptionalAction,
+                       help="Force word-level alignment on or off "
+                            "(default: on unless --format plain)")
     
     args = parser.parse_args()
+    if args.inputs:
+        if args.input_file or args.output_file:
+            parser.error("--inputs cannot be combined with input_file/output_file")
+    elif not (args.input_file and args.output_file):
+        parser.error("input_file and output_file are required unless --inputs is given")
+    
+    if args.snippet_size is not None and args.format != "snippet":
+        parser.error(f"--snippet-size cannot be used with --format {args.format}")
+    if args.snippet_size is not None and args.snippet_size < 1:
+        parser.error("--snippet-size must be at least 1")
+    if args.format == "plain":
+        snippet_size = None
+    elif args.format == "second":
+        snippet_size = 1
+    else:
+        snippet_size = 5 if args.snippet_size is None else args.snippet_size
     
     try:
-        transcribe_audio(args.input_file, args.output_file, args.model, args.snippet_size)
+        if args.inputs:
+            transcribe_files(args.inputs, args.output_dir, args.model, snippet_size,
+                             batch_size=args.batch_size, compute_type=args.compute_type,
+                             word_timestamps=args.word_timestamps, device=args.device)
+        else:
+            transcribe_audio(args.input_file, args.output_file, args.model, snippet_size,
+                             batch_size=args.batch_size, compute_type=args.compute_type,
+                             word_timestamps=args.word_timestamps, device=args.device)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)